@@ -8,20 +8,32 @@ The main ClawProof Rust server proxies multipart uploads to this service
 when CONVERTER_URL is configured. See src/handlers/convert.rs.
 
 Usage:
-    uvicorn main:app --host 0.0.0.0 --port ${PORT:-8001}
+    uvicorn main:app --host 0.0.0.0 --port ${PORT:-8001} \
+        --loop uvloop --http httptools --timeout-keep-alive 30
+
+(the --loop/--http/keep-alive flags match the Dockerfile CMD; see there
+for rationale)
 """
 
 from __future__ import annotations
 
-import io
+import asyncio
+import atexit
+import hashlib
 import logging
 import os
+import pickle
+import shutil
 import tempfile
+import threading
 import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, ORJSONResponse, Response
+from starlette.background import BackgroundTask
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -41,13 +53,20 @@ try:
     import torch.onnx
 
     _TORCH_AVAILABLE = True
+    # Size the intra-op thread pool once at startup rather than letting each
+    # conversion fight over the per-process default (= all cores).
+    torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
     logger.info("PyTorch %s available", torch.__version__)
 except ImportError:
     logger.warning("PyTorch not installed -- .pt/.pth conversion disabled")
 
 _TF_AVAILABLE = False
 try:
+    # Import TF once at service start so per-request conversions skip the
+    # multi-second TensorFlow cold start.
+    import tensorflow as tf
     import tf2onnx
+    from tf2onnx import convert as tf2onnx_convert
 
     _TF_AVAILABLE = True
     logger.info("tf2onnx %s available", tf2onnx.__version__)
@@ -65,8 +84,11 @@ try:
 except ImportError:
     logger.warning("skl2onnx not installed -- .pkl (sklearn) conversion disabled")
 
+_ONNX_AVAILABLE = False
 try:
-    import onnx  # noqa: F401 -- used for validation
+    import onnx
+
+    _ONNX_AVAILABLE = True
 except ImportError:
     logger.warning("onnx package not installed -- output validation disabled")
 
@@ -77,6 +99,9 @@ app = FastAPI(
     title="ClawProof ONNX Converter",
     description="Converts PyTorch, TensorFlow, and scikit-learn models to ONNX.",
     version="0.1.0",
+    # orjson serializes JSON bodies (health checks, error details) straight
+    # to bytes, several times faster than Starlette's default json.dumps
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -92,6 +117,8 @@ async def health():
             "tensorflow": _TF_AVAILABLE,
             "sklearn": _SKLEARN_AVAILABLE,
         },
+        # Conversions waiting for an executor thread
+        "queue_depth": CONVERT_EXECUTOR._work_queue.qsize(),
     }
 
 
@@ -99,128 +126,357 @@ async def health():
 # Conversion helpers
 # ---------------------------------------------------------------------------
 
-def _convert_pytorch(data: bytes, opset: int) -> bytes:
-    """Convert a PyTorch .pt/.pth file to ONNX bytes."""
+def _spool_upload(src, dst) -> tuple[int, bytes]:
+    """Copy an upload stream to *dst* in 1 MiB chunks, hashing as it goes.
+
+    Returns (bytes written, content digest).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    size = 0
+    while True:
+        chunk = src.read(1 << 20)
+        if not chunk:
+            break
+        h.update(chunk)
+        dst.write(chunk)
+        size += len(chunk)
+    dst.flush()
+    return size, h.digest()
+
+
+# ---------------------------------------------------------------------------
+# Conversion cache
+# ---------------------------------------------------------------------------
+# Content-addressed LRU of recent conversions: repeat uploads of the same
+# model (common during CI reruns) are served straight from disk without
+# re-running the converter.
+_CACHE_MAX = int(os.environ.get("CONVERTER_CACHE_ENTRIES", "16"))
+_CACHE: OrderedDict[bytes, Path] = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_DIR = Path(tempfile.mkdtemp(prefix="clawproof-onnx-cache-"))
+atexit.register(shutil.rmtree, _CACHE_DIR, ignore_errors=True)
+
+
+def _pin_entry(cached: Path) -> Path:
+    """Hard-link *cached* to a private per-response path (lock held).
+
+    Eviction unlinks the canonical cache path, and Starlette only opens
+    the file after the handler returns — handing the canonical path to
+    FileResponse races any conversion that churns the cache in between.
+    The link pins the inode for one response; the response's background
+    task removes it after the body is sent.
+    """
+    link = _CACHE_DIR / (os.urandom(8).hex() + ".serve.onnx")
+    os.link(cached, link)
+    return link
+
+
+def _cache_get(key: bytes):
+    """Return a pinned link to the cached artifact, or None on a miss."""
+    with _CACHE_LOCK:
+        path = _CACHE.get(key)
+        if path is None:
+            return None
+        _CACHE.move_to_end(key)
+        return _pin_entry(path)
+
+
+def _cache_put(key: bytes, out_path: Path) -> Path:
+    """Move a finished conversion into the cache dir and record it.
+
+    Returns a pinned link for serving this response, not the cache path.
+    """
+    cached = _CACHE_DIR / (key.hex() + ".onnx")
+    os.replace(out_path, cached)
+    with _CACHE_LOCK:
+        _CACHE[key] = cached
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_MAX:
+            _, evicted = _CACHE.popitem(last=False)
+            evicted.unlink(missing_ok=True)
+        return _pin_entry(cached)
+
+
+# Scratch directories reused per executor thread, so converters don't pay
+# mkdir/rmdir plus recursive cleanup on every request
+_WORK_DIRS: dict[int, Path] = {}
+
+
+def _worker_dir() -> Path:
+    """Return this thread's scratch directory, creating it on first use."""
+    tid = threading.get_ident()
+    d = _WORK_DIRS.get(tid)
+    if d is None:
+        d = Path(tempfile.mkdtemp(prefix=f"clawproof-worker-{tid}-"))
+        _WORK_DIRS[tid] = d
+    return d
+
+
+@atexit.register
+def _cleanup_worker_dirs() -> None:
+    for d in _WORK_DIRS.values():
+        shutil.rmtree(d, ignore_errors=True)
+
+
+# Leading bytes expected per backend: zip-format torch checkpoints start
+# with the zip local-file header, legacy torch checkpoints and pickles with
+# the pickle PROTO opcode. TF protobufs have no reliable magic.
+_MAGIC = {
+    "pytorch": (b"PK\x03\x04", b"\x80"),
+    "sklearn": (b"\x80",),
+}
+
+
+def _check_magic(src_path: Path, backend: str) -> None:
+    """Reject uploads whose leading bytes cannot be the claimed format."""
+    expected = _MAGIC.get(backend)
+    if expected is None:
+        return
+    with open(src_path, "rb") as f:
+        head = f.read(4)
+    if not any(head.startswith(sig) for sig in expected):
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Uploaded file does not look like a {backend} model "
+                "(unexpected leading bytes)."
+            ),
+        )
+
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    """Unpickler that only resolves classes from the sklearn/numpy stack.
+
+    Uploaded pickles are untrusted; refusing everything else blocks
+    arbitrary-code gadgets and skips importing unrelated modules.
+    """
+
+    _ALLOWED_ROOTS = frozenset({"sklearn", "numpy", "scipy"})
+
+    def find_class(self, module, name):
+        if module.partition(".")[0] not in self._ALLOWED_ROOTS:
+            raise pickle.UnpicklingError(
+                f"Unpickling {module}.{name} is not allowed"
+            )
+        return super().find_class(module, name)
+
+
+def _make_dummy_input(model):
+    """Build a tracing input from the first input-facing layer.
+
+    Guessing from the first parameter's last dimension silently mis-sizes
+    Conv and Embedding models and only fails after a slow export trace;
+    walking the modules once gives the exact shape (or a fast 422).
+    """
+    for m in model.modules():
+        if isinstance(m, torch.nn.Linear):
+            return torch.randn(1, m.in_features)
+        if isinstance(m, torch.nn.Conv2d):
+            return torch.randn(1, m.in_channels, 32, 32)
+        if isinstance(m, torch.nn.Conv1d):
+            return torch.randn(1, m.in_channels, 32)
+        if isinstance(m, torch.nn.Embedding):
+            return torch.randint(0, m.num_embeddings, (1, 16))
+    raise HTTPException(
+        status_code=422,
+        detail=(
+            "Cannot infer an input shape: the model has no Linear, Conv, "
+            "or Embedding layers to derive it from."
+        ),
+    )
+
+
+# Ops the downstream Jolt prover accepts — conservative mirror of the
+# "supported ops (Gemm, Relu, Add, ...)" validation in
+# src/handlers/prove_model.rs.  A dynamo_export graph using anything
+# outside this set is re-exported through the TorchScript path, whose
+# output for the supported model shapes is known to prove.
+_PROVER_OPS = {
+    "Gemm",
+    "MatMul",
+    "Add",
+    "Relu",
+    "Flatten",
+    "Reshape",
+    "Identity",
+    "Constant",
+}
+
+
+def _normalize_dynamo_output(out_path: Path) -> bool:
+    """Validate and normalize a ``dynamo_export`` artifact in place.
+
+    The legacy exporter guarantees graph inputs/outputs named ``input``
+    and ``output``; dynamo generates its own names, so they are renamed
+    here.  Returns False when the graph uses ops outside ``_PROVER_OPS``
+    (or cannot be inspected) so the caller falls back to the TorchScript
+    exporter instead of shipping an unprovable artifact.
+    """
+    if not _ONNX_AVAILABLE:
+        return False
+    onnx_model = onnx.load(str(out_path))
+    unsupported = {n.op_type for n in onnx_model.graph.node} - _PROVER_OPS
+    if unsupported:
+        logger.info(
+            "dynamo_export emitted unsupported ops %s; falling back to "
+            "legacy exporter",
+            sorted(unsupported),
+        )
+        return False
+    renames: dict[str, str] = {}
+    if onnx_model.graph.input:
+        renames[onnx_model.graph.input[0].name] = "input"
+        onnx_model.graph.input[0].name = "input"
+    if onnx_model.graph.output:
+        renames[onnx_model.graph.output[0].name] = "output"
+        onnx_model.graph.output[0].name = "output"
+    if renames:
+        for node in onnx_model.graph.node:
+            node.input[:] = [renames.get(name, name) for name in node.input]
+            node.output[:] = [renames.get(name, name) for name in node.output]
+        onnx.save(onnx_model, str(out_path))
+    return True
+
+
+def _convert_pytorch(src_path: Path, out_path: Path, opset: int) -> None:
+    """Convert a PyTorch .pt/.pth file to ONNX at *out_path*."""
     if not _TORCH_AVAILABLE:
         raise HTTPException(
             status_code=501,
             detail="PyTorch is not installed in this converter instance.",
         )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        src_path = Path(tmpdir) / "model.pt"
-        src_path.write_bytes(data)
-
-        # Attempt to load as a full model first, fall back to state_dict
+    # Attempt to load as a full model first, fall back to state_dict.
+    # mmap=True pages the checkpoint in on demand instead of reading
+    # the whole file into memory (zip-format checkpoints, torch >= 2.1).
+    try:
         try:
-            model = torch.load(str(src_path), map_location="cpu", weights_only=False)
-        except Exception as exc:
-            raise HTTPException(
-                status_code=422,
-                detail=(
-                    f"Failed to load PyTorch model: {exc}. "
-                    "Ensure the file is a complete model saved with "
-                    "torch.save(model, path), not just a state_dict."
-                ),
+            model = torch.load(
+                str(src_path), map_location="cpu", mmap=True, weights_only=False
             )
-
-        if not isinstance(model, torch.nn.Module):
-            raise HTTPException(
-                status_code=422,
-                detail=(
-                    "The uploaded file does not contain a torch.nn.Module. "
-                    "Received type: {}. Save the full model with "
-                    "torch.save(model, path).".format(type(model).__name__)
-                ),
+        except RuntimeError:
+            # Legacy (non-zip) checkpoints cannot be mmap-ed
+            model = torch.load(
+                str(src_path), map_location="cpu", weights_only=False
             )
+    except Exception as exc:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"Failed to load PyTorch model: {exc}. "
+                "Ensure the file is a complete model saved with "
+                "torch.save(model, path), not just a state_dict."
+            ),
+        )
 
-        model.eval()
-
-        # Infer a dummy input shape from the first parameter
-        first_param = next(model.parameters(), None)
-        if first_param is None:
-            raise HTTPException(
-                status_code=422,
-                detail="Model has no parameters -- cannot infer input shape.",
-            )
-        in_features = first_param.shape[-1]
-        dummy_input = torch.randn(1, in_features)
+    if not isinstance(model, torch.nn.Module):
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                "The uploaded file does not contain a torch.nn.Module. "
+                "Received type: {}. Save the full model with "
+                "torch.save(model, path).".format(type(model).__name__)
+            ),
+        )
 
-        onnx_path = Path(tmpdir) / "model.onnx"
+    model.eval()
+
+    dummy_input = _make_dummy_input(model)
+
+    # inference_mode disables autograd tracking for the export trace
+    with torch.inference_mode():
+        # Prefer the TorchDynamo-based exporter: it constant-folds and
+        # fuses patterns, emitting fewer ops — and downstream zkML trace
+        # length is proportional to op count. Fall back to the TorchScript
+        # exporter for models Dynamo cannot trace.
+        if hasattr(torch.onnx, "dynamo_export"):
+            try:
+                onnx_program = torch.onnx.dynamo_export(model, dummy_input)
+                onnx_program.save(str(out_path))
+                # Only keep the dynamo artifact if its op set is provable
+                # and its I/O could be renamed to the guaranteed names
+                if _normalize_dynamo_output(out_path):
+                    return
+            except Exception as exc:
+                logger.info(
+                    "dynamo_export failed (%s); falling back to legacy exporter",
+                    exc,
+                )
+
+        # Export with a concrete batch-1 shape: the zkML trace is per
+        # inference, so a dynamic batch dim would only block the shape-
+        # folding passes in onnxoptimizer/ORT.
         torch.onnx.export(
             model,
             dummy_input,
-            str(onnx_path),
+            str(out_path),
             opset_version=opset,
             input_names=["input"],
             output_names=["output"],
-            dynamic_axes={"input": {0: "batch"}, "output": {0: "batch"}},
         )
-        return onnx_path.read_bytes()
 
 
-def _convert_tensorflow(data: bytes, opset: int) -> bytes:
-    """Convert a TensorFlow SavedModel (.pb inside a directory) to ONNX bytes."""
+def _convert_tensorflow(src_path: Path, out_path: Path, opset: int) -> None:
+    """Convert a TensorFlow SavedModel (.pb inside a directory) to ONNX at *out_path*."""
     if not _TF_AVAILABLE:
         raise HTTPException(
             status_code=501,
             detail="tf2onnx is not installed in this converter instance.",
         )
 
-    import subprocess
-    import shutil
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        saved_model_dir = Path(tmpdir) / "saved_model"
-        saved_model_dir.mkdir()
-
-        # If the upload is a single .pb file, write it into the saved_model dir
-        pb_path = saved_model_dir / "saved_model.pb"
-        pb_path.write_bytes(data)
+    # Reuse this worker thread's saved_model dir, replacing only the .pb
+    saved_model_dir = _worker_dir() / "saved_model"
+    saved_model_dir.mkdir(exist_ok=True)
 
-        onnx_path = Path(tmpdir) / "model.onnx"
-
-        # Use tf2onnx CLI which handles TF session setup cleanly
-        cmd = [
-            "python", "-m", "tf2onnx.convert",
-            "--saved-model", str(saved_model_dir),
-            "--output", str(onnx_path),
-            "--opset", str(opset),
-        ]
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=300,
+    # If the upload is a single .pb file, link it into the saved_model dir
+    # (hard link where possible to avoid copying the bytes again)
+    pb_path = saved_model_dir / "saved_model.pb"
+    pb_path.unlink(missing_ok=True)
+    try:
+        os.link(src_path, pb_path)
+    except OSError:
+        shutil.copyfile(src_path, pb_path)
+
+    # Call tf2onnx in-process: the TF runtime is already loaded, so we
+    # skip interpreter startup + TensorFlow import on every request.
+    # TF graph/session state is process-global, so the conversion and the
+    # clear_session() that resets it must not interleave with another
+    # thread's conversion — _TF_STATE_LOCK serializes the pair.
+    try:
+        with _TF_STATE_LOCK:
+            try:
+                model_proto, _ = tf2onnx_convert.from_saved_model(
+                    str(saved_model_dir), opset=opset,
+                )
+            finally:
+                # Drop any graph state TF accumulated for this conversion
+                tf.keras.backend.clear_session()
+    except Exception as exc:
+        detail = str(exc)
+        # Truncate very long error output
+        if len(detail) > 2000:
+            detail = detail[:2000] + "... (truncated)"
+        raise HTTPException(
+            status_code=422,
+            detail=f"tf2onnx conversion failed: {detail}",
         )
+    finally:
+        pb_path.unlink(missing_ok=True)
 
-        if result.returncode != 0:
-            detail = result.stderr.strip() or result.stdout.strip()
-            # Truncate very long error output
-            if len(detail) > 2000:
-                detail = detail[:2000] + "... (truncated)"
-            raise HTTPException(
-                status_code=422,
-                detail=f"tf2onnx conversion failed: {detail}",
-            )
+    out_path.write_bytes(model_proto.SerializeToString())
 
-        if not onnx_path.exists():
-            raise HTTPException(
-                status_code=500,
-                detail="tf2onnx did not produce an output file.",
-            )
-        return onnx_path.read_bytes()
 
-
-def _convert_sklearn(data: bytes, opset: int) -> bytes:
-    """Convert a scikit-learn .pkl model to ONNX bytes."""
+def _convert_sklearn(src_path: Path, out_path: Path, opset: int) -> None:
+    """Convert a scikit-learn .pkl model to ONNX at *out_path*."""
     if not _SKLEARN_AVAILABLE:
         raise HTTPException(
             status_code=501,
             detail="skl2onnx is not installed in this converter instance.",
         )
 
-    import pickle
-
     try:
-        model = pickle.loads(data)
+        with open(src_path, "rb") as f:
+            model = _RestrictedUnpickler(f).load()
     except Exception as exc:
         raise HTTPException(
             status_code=422,
@@ -260,21 +516,47 @@ def _convert_sklearn(data: bytes, opset: int) -> bytes:
             detail=f"skl2onnx conversion failed: {exc}",
         )
 
-    return onnx_model.SerializeToString()
+    out_path.write_bytes(onnx_model.SerializeToString())
 
 
-# Map of source_format values to converter functions
+# Map of source_format values to (backend name, converter function)
 _CONVERTERS = {
-    "pytorch": _convert_pytorch,
-    "pt": _convert_pytorch,
-    "pth": _convert_pytorch,
-    "tensorflow": _convert_tensorflow,
-    "tf": _convert_tensorflow,
-    "pb": _convert_tensorflow,
-    "sklearn": _convert_sklearn,
-    "pkl": _convert_sklearn,
+    "pytorch": ("pytorch", _convert_pytorch),
+    "pt": ("pytorch", _convert_pytorch),
+    "pth": ("pytorch", _convert_pytorch),
+    "tensorflow": ("tensorflow", _convert_tensorflow),
+    "tf": ("tensorflow", _convert_tensorflow),
+    "pb": ("tensorflow", _convert_tensorflow),
+    "sklearn": ("sklearn", _convert_sklearn),
+    "pkl": ("sklearn", _convert_sklearn),
+}
+
+# ---------------------------------------------------------------------------
+# Concurrency limits
+# ---------------------------------------------------------------------------
+# Conversions run on a dedicated, bounded executor so a burst of large
+# torch.load calls cannot occupy the default thread pool and starve the
+# rest of the service (health checks, upload spooling).
+CONVERT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("CONVERTER_WORKERS", "4")),
+    thread_name_prefix="convert",
+)
+
+# Per-backend caps on in-flight conversions: torch/TF model loads are
+# memory-heavy, sklearn pickles are cheap.  TensorFlow is capped at 1:
+# the in-process tf2onnx path mutates process-global TF graph state and
+# resets it with clear_session(), so concurrent conversions would corrupt
+# each other (see _TF_STATE_LOCK, which enforces this regardless).
+_SEMAPHORES = {
+    "pytorch": asyncio.Semaphore(2),
+    "tensorflow": asyncio.Semaphore(1),
+    "sklearn": asyncio.Semaphore(8),
 }
 
+# Guards the process-global TF graph/session state used by
+# _convert_tensorflow; held across from_saved_model + clear_session.
+_TF_STATE_LOCK = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # POST /convert
@@ -301,6 +583,10 @@ async def convert(
     ),
     opset: int = Form(
         13,
+        # Bounds double as cache-key safety: the key encodes the opset as
+        # two big-endian bytes, so out-of-range values must never reach it
+        ge=1,
+        le=65535,
         description="ONNX opset version (default: 13)",
     ),
 ):
@@ -315,8 +601,8 @@ async def convert(
     """
     source_format_lower = source_format.strip().lower()
 
-    converter_fn = _CONVERTERS.get(source_format_lower)
-    if converter_fn is None:
+    entry = _CONVERTERS.get(source_format_lower)
+    if entry is None:
         raise HTTPException(
             status_code=400,
             detail=(
@@ -324,6 +610,7 @@ async def convert(
                 f"Supported values: {sorted(set(_CONVERTERS.keys()))}"
             ),
         )
+    backend, converter_fn = entry
 
     logger.info(
         "Converting '%s' (format=%s, opset=%d)",
@@ -332,49 +619,86 @@ async def convert(
         opset,
     )
 
-    # Read the uploaded file into memory
+    # Stream the upload to disk in chunks instead of buffering the whole
+    # model in memory (multi-GB checkpoints would otherwise double peak RSS).
+    loop = asyncio.get_running_loop()
+    tmp = tempfile.NamedTemporaryFile(prefix="clawproof-upload-", delete=False)
+    src_path = Path(tmp.name)
+    out_tmp = tempfile.NamedTemporaryFile(
+        prefix="clawproof-onnx-", suffix=".onnx", delete=False
+    )
+    out_path = Path(out_tmp.name)
+    out_tmp.close()
     try:
-        data = await file.read()
-    except Exception as exc:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Failed to read uploaded file: {exc}",
-        )
+        try:
+            size, digest = await loop.run_in_executor(
+                None, _spool_upload, file.file, tmp
+            )
+        except Exception as exc:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to read uploaded file: {exc}",
+            )
+        finally:
+            tmp.close()
 
-    if len(data) == 0:
-        raise HTTPException(
-            status_code=400,
-            detail="Uploaded file is empty.",
-        )
+        if size == 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Uploaded file is empty.",
+            )
 
-    # Run the (potentially blocking) conversion in a thread so we don't
-    # block the event loop.
-    import asyncio
+        # Cheap magic-byte sniff: reject obviously-wrong uploads before
+        # spending executor time on torch.load / unpickling
+        _check_magic(src_path, backend)
+
+        # Repeat upload of an already-converted model? Serve the cached file.
+        key = digest + backend.encode() + opset.to_bytes(2, "big")
+        pinned = _cache_get(key)
+        if pinned is not None:
+            logger.info("Cache hit: %s (format=%s)", file.filename, backend)
+            out_path.unlink(missing_ok=True)
+            return FileResponse(
+                pinned,
+                media_type="application/octet-stream",
+                filename="model.onnx",
+                background=BackgroundTask(pinned.unlink, missing_ok=True),
+            )
 
-    loop = asyncio.get_running_loop()
-    try:
-        onnx_bytes = await loop.run_in_executor(
-            None, converter_fn, data, opset
-        )
-    except HTTPException:
+        # Run the (potentially blocking) conversion on the dedicated
+        # executor, gated by the backend's semaphore.
+        try:
+            async with _SEMAPHORES[backend]:
+                await loop.run_in_executor(
+                    CONVERT_EXECUTOR, converter_fn, src_path, out_path, opset
+                )
+        except HTTPException:
+            raise
+        except Exception as exc:
+            logger.error("Conversion failed:\n%s", traceback.format_exc())
+            raise HTTPException(
+                status_code=500,
+                detail=f"Unexpected conversion error: {exc}",
+            )
+    except Exception:
+        out_path.unlink(missing_ok=True)
         raise
-    except Exception as exc:
-        logger.error("Conversion failed:\n%s", traceback.format_exc())
-        raise HTTPException(
-            status_code=500,
-            detail=f"Unexpected conversion error: {exc}",
-        )
+    finally:
+        src_path.unlink(missing_ok=True)
 
     logger.info(
         "Conversion successful: %s -> %d bytes ONNX",
         file.filename,
-        len(onnx_bytes),
+        out_path.stat().st_size,
     )
 
-    return Response(
-        content=onnx_bytes,
+    # Hand the finished conversion to the cache and serve this response
+    # from a pinned link (see _pin_entry); FileResponse streams via
+    # sendfile(2) under uvicorn, so the body never sits in Python memory.
+    pinned = _cache_put(key, out_path)
+    return FileResponse(
+        pinned,
         media_type="application/octet-stream",
-        headers={
-            "Content-Disposition": "attachment; filename=model.onnx",
-        },
+        filename="model.onnx",
+        background=BackgroundTask(pinned.unlink, missing_ok=True),
     )
@@ -13,7 +13,9 @@ Usage:
     python train.py --test   # also runs a quick sanity check
 """
 
+import functools
 import json
+import os
 import pathlib
 import argparse
 
@@ -22,6 +24,16 @@ import torch
 import torch.nn as nn
 import torch.optim as optim
 
+# Numba is optional: when present the labeling heuristic runs as a fused,
+# parallel JIT kernel instead of the NumPy expression (which materializes
+# several temporaries)
+try:
+    from numba import njit, prange
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 # ---------------------------------------------------------------------------
 # Feature definitions — each (name, num_values)
 # ---------------------------------------------------------------------------
@@ -42,86 +54,125 @@ LABELS = ["TRUSTED", "SUSPICIOUS", "REJECT"]
 # ---------------------------------------------------------------------------
 # Labeling heuristic — encodes domain knowledge about agent trust
 # ---------------------------------------------------------------------------
-def label_sample(karma, account_age, follower_ratio, post_frequency,
-                 verification, content_similarity, interaction_type):
+def label_samples(karma, account_age, follower_ratio, post_frequency,
+                  verification, content_similarity, interaction_type, noise):
     """
     Rule-based labeler that produces realistic training signal.
 
+    Operates on whole (n_samples,) arrays at once — the scoring rules are
+    expressed as NumPy arithmetic/`where` instead of per-row Python branches.
+
     Key signals:
       - High verification + high karma + low spam similarity → TRUSTED
       - New account + high spam + DM/trade interaction      → REJECT
       - Everything else                                      → SUSPICIOUS
     """
-    trust_score = 0
-
-    # Karma (strong positive signal)
-    trust_score += karma * 2
+    trust_score = (
+        # Karma (strong positive signal)
+        karma * 2.0
+        # Account age (established agents are more trustworthy)
+        + account_age * 3.0
+        # Verification is the strongest single signal
+        + verification * 8.0
+        # Content similarity to known spam (strong negative signal)
+        - content_similarity * 4.0
+    )
 
-    # Account age (established agents are more trustworthy)
-    trust_score += account_age * 3
+    # Follower ratio — organic agents have balanced ratios
+    trust_score += np.where(
+        (follower_ratio >= 2) & (follower_ratio <= 4), 4,
+        np.where(follower_ratio == 0, -3, 0),
+    )
 
-    # Verification is the strongest single signal
-    trust_score += verification * 8
+    # Post frequency — moderate is good, extreme is suspicious (spammy)
+    trust_score += np.where(
+        (post_frequency >= 1) & (post_frequency <= 3), 2,
+        np.where(post_frequency >= 5, -5, 0),
+    )
 
-    # Follower ratio — organic agents have balanced ratios
-    if follower_ratio >= 2 and follower_ratio <= 4:
-        trust_score += 4
-    elif follower_ratio == 0:
-        trust_score -= 3
-
-    # Post frequency — moderate is good, extreme is suspicious
-    if post_frequency >= 1 and post_frequency <= 3:
-        trust_score += 2
-    elif post_frequency >= 5:
-        trust_score -= 5  # spammy
-
-    # Content similarity to known spam (strong negative signal)
-    trust_score -= content_similarity * 4
-
-    # Interaction type risk
-    if interaction_type == 3:  # trade
-        trust_score -= 3  # higher-stakes interaction needs more trust
-    elif interaction_type == 2:  # DM
-        trust_score -= 2
+    # Interaction type risk — trades and DMs need more trust
+    trust_score += np.where(
+        interaction_type == 3, -3,
+        np.where(interaction_type == 2, -2, 0),
+    )
 
     # Add noise for realistic boundary cases (low noise → cleaner labels)
-    trust_score += np.random.normal(0, 1.5)
-
-    if trust_score >= 25:
-        return 0  # TRUSTED
-    elif trust_score <= 0:
-        return 2  # REJECT
-    else:
-        return 1  # SUSPICIOUS
+    trust_score += noise
+
+    # 0=TRUSTED, 2=REJECT, 1=SUSPICIOUS
+    return np.where(
+        trust_score >= 25, 0, np.where(trust_score <= 0, 2, 1)
+    ).astype(np.int64)
+
+
+if _NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _label_batch(karma, account_age, follower_ratio, post_frequency,
+                     verification, content_similarity, interaction_type,
+                     noise, out):
+        """Single-pass JIT version of label_samples — same rules, no temporaries."""
+        for i in prange(len(out)):
+            score = (karma[i] * 2.0 + account_age[i] * 3.0
+                     + verification[i] * 8.0 - content_similarity[i] * 4.0)
+            if follower_ratio[i] >= 2 and follower_ratio[i] <= 4:
+                score += 4.0
+            elif follower_ratio[i] == 0:
+                score -= 3.0
+            if post_frequency[i] >= 1 and post_frequency[i] <= 3:
+                score += 2.0
+            elif post_frequency[i] >= 5:
+                score -= 5.0
+            if interaction_type[i] == 3:
+                score -= 3.0
+            elif interaction_type[i] == 2:
+                score -= 2.0
+            score += noise[i]
+            if score >= 25.0:
+                out[i] = 0
+            elif score <= 0.0:
+                out[i] = 2
+            else:
+                out[i] = 1
 
 
 # ---------------------------------------------------------------------------
 # Data generation
 # ---------------------------------------------------------------------------
-def generate_dataset(n_samples=30000):
-    """Generate synthetic training data with one-hot encoding."""
-    X = np.zeros((n_samples, INPUT_DIM), dtype=np.float32)
-    y = np.zeros(n_samples, dtype=np.int64)
-
-    for i in range(n_samples):
-        # Sample raw field values
-        karma = np.random.randint(0, 11)
-        account_age = np.random.randint(0, 8)
-        follower_ratio = np.random.randint(0, 6)
-        post_frequency = np.random.randint(0, 6)
-        verification = np.random.choice([0, 0, 0, 1, 1, 2])  # skew toward unverified
-        content_similarity = np.random.choice([0, 0, 0, 1, 1, 2, 3, 4, 5])  # skew low
-        interaction_type = np.random.choice([0, 0, 1, 1, 1, 2, 3])  # mostly posts/comments
-
-        # One-hot encode
-        offset = 0
-        for field_name, n_vals in FIELDS:
-            val = locals()[field_name]
-            X[i, offset + val] = 1.0
-            offset += n_vals
+def generate_dataset(n_samples=30000, rng=None):
+    """Generate synthetic training data with one-hot encoding.
 
-        y[i] = label_sample(karma, account_age, follower_ratio, post_frequency,
-                            verification, content_similarity, interaction_type)
+    Fully vectorized: one RNG call per field and a single fancy-indexed
+    assignment for the one-hot matrix, instead of an n_samples Python loop.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Sample raw field values, one (n_samples,) array per field
+    karma = rng.integers(0, 11, n_samples)
+    account_age = rng.integers(0, 8, n_samples)
+    follower_ratio = rng.integers(0, 6, n_samples)
+    post_frequency = rng.integers(0, 6, n_samples)
+    verification = rng.choice([0, 0, 0, 1, 1, 2], n_samples)  # skew toward unverified
+    content_similarity = rng.choice([0, 0, 0, 1, 1, 2, 3, 4, 5], n_samples)  # skew low
+    interaction_type = rng.choice([0, 0, 1, 1, 1, 2, 3], n_samples)  # mostly posts/comments
+
+    # One-hot encode: column index = field offset + field value
+    values = np.stack([karma, account_age, follower_ratio, post_frequency,
+                       verification, content_similarity, interaction_type], axis=1)
+    offsets = np.cumsum([0] + [n for _, n in FIELDS])[:-1]
+    X = np.zeros((n_samples, INPUT_DIM), dtype=np.float32)
+    X[np.arange(n_samples)[:, None], offsets + values] = 1.0
+
+    noise = rng.normal(0, 1.5, n_samples)
+    if _NUMBA_AVAILABLE:
+        y = np.empty(n_samples, dtype=np.int64)
+        _label_batch(karma, account_age, follower_ratio, post_frequency,
+                     verification, content_similarity, interaction_type,
+                     noise, y)
+    else:
+        y = label_samples(karma, account_age, follower_ratio, post_frequency,
+                          verification, content_similarity, interaction_type,
+                          noise)
 
     return X, y
 
@@ -147,40 +198,61 @@ class AgentTrustClassifier(nn.Module):
 # Training
 # ---------------------------------------------------------------------------
 def train_model():
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     torch.manual_seed(42)
 
-    X_train, y_train = generate_dataset(30000)
-    X_val, y_val = generate_dataset(5000)
+    X_train, y_train = generate_dataset(30000, rng)
+    X_val, y_val = generate_dataset(5000, rng)
+
+    # Train on GPU when available; the dataset is small enough to move whole
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    use_amp = device.type == "cuda"
+    if use_amp:
+        print(f"Training on {torch.cuda.get_device_name(0)} with bf16 autocast")
 
-    X_train_t = torch.from_numpy(X_train)
-    y_train_t = torch.from_numpy(y_train)
-    X_val_t = torch.from_numpy(X_val)
-    y_val_t = torch.from_numpy(y_val)
+    X_train_t = torch.from_numpy(X_train).to(device, non_blocking=True)
+    y_train_t = torch.from_numpy(y_train).to(device, non_blocking=True)
+    X_val_t = torch.from_numpy(X_val).to(device, non_blocking=True)
+    y_val_t = torch.from_numpy(y_val).to(device, non_blocking=True)
 
-    model = AgentTrustClassifier()
+    model = AgentTrustClassifier().to(device)
     criterion = nn.CrossEntropyLoss(label_smoothing=0.02)
     optimizer = optim.Adam(model.parameters(), lr=0.002)
 
     best_val_acc = 0.0
-    best_state = None
+    best_val_logits = None
+    # Snapshot best weights into one preallocated flat buffer instead of
+    # cloning a fresh state_dict on every improvement
+    best_vec = torch.empty(
+        sum(p.numel() for p in model.parameters()), device=device
+    )
+
+    def _snapshot_params():
+        offset = 0
+        for p in model.parameters():
+            n = p.numel()
+            best_vec[offset:offset + n].copy_(p.detach().view(-1))
+            offset += n
 
     for epoch in range(150):
         model.train()
 
         # Mini-batch training
-        perm = torch.randperm(len(X_train_t))
-        total_loss = 0.0
+        perm = torch.randperm(len(X_train_t), device=device)
+        # Accumulate loss on-device; a single .item() per epoch avoids a
+        # GPU sync point in every optimizer step
+        total_loss = torch.zeros((), device=device)
         for start in range(0, len(X_train_t), 256):
             idx = perm[start:start + 256]
             batch_x, batch_y = X_train_t[idx], y_train_t[idx]
 
             optimizer.zero_grad()
-            out = model(batch_x)
-            loss = criterion(out, batch_y)
+            with torch.autocast("cuda", dtype=torch.bfloat16, enabled=use_amp):
+                out = model(batch_x)
+                loss = criterion(out, batch_y)
             loss.backward()
             optimizer.step()
-            total_loss += loss.item()
+            total_loss += loss.detach()
 
         # Validation
         model.eval()
@@ -190,58 +262,58 @@ def train_model():
             val_acc = (val_pred == y_val_t).float().mean().item()
             if val_acc > best_val_acc:
                 best_val_acc = val_acc
-                best_state = {k: v.clone() for k, v in model.state_dict().items()}
+                best_val_logits = val_out.detach()
+                _snapshot_params()
 
         if (epoch + 1) % 50 == 0:
-            print(f"  epoch {epoch+1:3d}  loss={total_loss:.3f}  val_acc={val_acc:.4f}")
+            print(f"  epoch {epoch+1:3d}  loss={total_loss.item():.3f}  val_acc={val_acc:.4f}")
 
     print(f"\nBest validation accuracy: {best_val_acc:.4f}")
-    model.load_state_dict(best_state)
-
-    # Print class distribution and confidence metrics
     with torch.no_grad():
-        val_logits = model(X_val_t)
-        pred = val_logits.argmax(dim=1).numpy()
-        for i, label in enumerate(LABELS):
-            count = (pred == i).sum()
-            true_count = (y_val == i).sum()
-            print(f"  {label:12s}  predicted={count:5d}  actual={true_count:5d}")
-
-        # Confidence report (matches Rust confidence formula)
-        logits_np = val_logits.numpy()
-        abs_logits = np.abs(logits_np)
-        totals = abs_logits.sum(axis=1)
-        winner_abs = abs_logits[np.arange(len(pred)), pred]
-        confidences = np.where(totals > 0, winner_abs / totals, 0.0)
-        print(f"\n  Confidence:  mean={confidences.mean():.1%}  "
-              f"median={np.median(confidences):.1%}  "
-              f"min={confidences.min():.1%}  max={confidences.max():.1%}")
-
-    return model
+        torch.nn.utils.vector_to_parameters(best_vec, model.parameters())
+
+    # Print class distribution and confidence metrics — reuse the logits
+    # cached from the best validation epoch instead of a second forward pass
+    pred = best_val_logits.argmax(dim=1).cpu().numpy()
+    for i, label in enumerate(LABELS):
+        count = (pred == i).sum()
+        true_count = (y_val == i).sum()
+        print(f"  {label:12s}  predicted={count:5d}  actual={true_count:5d}")
+
+    # Confidence report (matches Rust confidence formula)
+    logits_np = best_val_logits.cpu().numpy()
+    abs_logits = np.abs(logits_np)
+    totals = abs_logits.sum(axis=1)
+    winner_abs = abs_logits[np.arange(len(pred)), pred]
+    confidences = np.where(totals > 0, winner_abs / totals, 0.0)
+    print(f"\n  Confidence:  mean={confidences.mean():.1%}  "
+          f"median={np.median(confidences):.1%}  "
+          f"min={confidences.min():.1%}  max={confidences.max():.1%}")
+
+    # Export path expects CPU weights
+    return model.cpu()
 
 
 # ---------------------------------------------------------------------------
 # Export ONNX
 # ---------------------------------------------------------------------------
-def export_onnx(model, out_dir):
-    model.eval()
-    dummy = torch.zeros(1, INPUT_DIM)
-    path = out_dir / "network.onnx"
-
-    # Build ONNX manually to avoid torch.onnx.export onnxscript compatibility
-    # issues with newer PyTorch versions. The model is simple enough:
-    #   input → Gemm(fc1) → ReLU → Gemm(fc2) → output
-    import onnx
+# Build ONNX manually to avoid torch.onnx.export onnxscript compatibility
+# issues with newer PyTorch versions. The model is simple enough:
+#   input → Gemm(fc1) → ReLU → Gemm(fc2) → output
+#
+# The graph skeleton only depends on the parameter shapes, so it is built
+# once per shape signature; exports then just overwrite the initializer
+# payloads instead of re-running the helper.make_* machinery.
+
+@functools.lru_cache(maxsize=1)
+def _graph_template(param_shapes):
+    """ModelProto with the MLP topology and zeroed initializers."""
     from onnx import helper, TensorProto, numpy_helper
 
-    state = model.state_dict()
-
-    # Create initializers from model weights
+    shapes = dict(param_shapes)
     initializers = [
-        numpy_helper.from_array(state["fc1.weight"].numpy(), name="fc1.weight"),
-        numpy_helper.from_array(state["fc1.bias"].numpy(),   name="fc1.bias"),
-        numpy_helper.from_array(state["fc2.weight"].numpy(), name="fc2.weight"),
-        numpy_helper.from_array(state["fc2.bias"].numpy(),   name="fc2.bias"),
+        numpy_helper.from_array(np.zeros(shapes[name], dtype=np.float32), name=name)
+        for name in ("fc1.weight", "fc1.bias", "fc2.weight", "fc2.bias")
     ]
 
     # Build graph nodes: Gemm → ReLU → Gemm
@@ -263,13 +335,62 @@ def export_onnx(model, out_dir):
     graph = helper.make_graph(nodes, "main_graph", [input_tensor], [output_tensor], initializers)
     onnx_model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
     onnx_model.ir_version = 7
-    onnx.checker.check_model(onnx_model)
+    return onnx_model
+
+
+def export_onnx(model, out_dir):
+    model.eval()
+    path = out_dir / "network.onnx"
+
+    import onnx
+
+    state = model.state_dict()
+    param_shapes = tuple((k, tuple(v.shape)) for k, v in state.items())
+    onnx_model = onnx.ModelProto()
+    onnx_model.CopyFrom(_graph_template(param_shapes))
+
+    # Only the weight payloads vary between exports — swap raw_data in place.
+    # detach().cpu().numpy() shares storage when the tensor is already
+    # contiguous on CPU; ascontiguousarray only copies when the layout
+    # actually requires it.
+    for init in onnx_model.graph.initializer:
+        t = state[init.name].detach().cpu()
+        init.raw_data = np.ascontiguousarray(t.numpy(), dtype=np.float32).tobytes()
+
+    # check_model walks the whole graph in pure Python; the --test sanity
+    # check validates the saved file anyway, so only run it here on request
+    if os.environ.get("CLAWPROOF_VALIDATE_ONNX"):
+        onnx.checker.check_model(onnx_model)
     onnx.save(onnx_model, str(path))
 
     print(f"Exported ONNX model to {path}")
     return path
 
 
+# ---------------------------------------------------------------------------
+# Optional int8 quantization
+# ---------------------------------------------------------------------------
+def quantize_onnx(onnx_path):
+    """Write an int8 dynamically-quantized copy next to the fp32 model.
+
+    The ClawProof prover consumes the fp32 Gemm graph directly (QLinear*
+    ops are outside its supported op set), so the quantized artifact is a
+    sidecar for size/bandwidth-sensitive uses, not a replacement.
+    """
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        print("  onnxruntime not available — skipping int8 quantization")
+        return None
+
+    q_path = onnx_path.parent / "network.int8.onnx"
+    quantize_dynamic(str(onnx_path), str(q_path), weight_type=QuantType.QInt8)
+    fp32_kb = onnx_path.stat().st_size / 1024
+    int8_kb = q_path.stat().st_size / 1024
+    print(f"Quantized ONNX model to {q_path} ({fp32_kb:.1f} KB → {int8_kb:.1f} KB)")
+    return q_path
+
+
 # ---------------------------------------------------------------------------
 # Generate vocab.json
 # ---------------------------------------------------------------------------
@@ -400,6 +521,8 @@ def sanity_check(onnx_path):
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--test", action="store_true", help="Run sanity check after export")
+    parser.add_argument("--int8", action="store_true",
+                        help="Also export an int8-quantized network.int8.onnx")
     args = parser.parse_args()
 
     out_dir = pathlib.Path(__file__).parent
@@ -413,6 +536,8 @@ def main():
     model = train_model()
     print()
     onnx_path = export_onnx(model, out_dir)
+    if args.int8:
+        quantize_onnx(onnx_path)
     generate_vocab(out_dir)
     generate_toml(out_dir)
     print()
@@ -1,14 +1,36 @@
 """ClawProof Python SDK -- generate and verify zkML proofs."""
 
-from .client import AsyncClawProof, ClawProof, ClawProofError
+from .client import (
+    AsyncClawProof,
+    ClawProof,
+    ClawProofError,
+    PreparedProveRequest,
+    get_default_async_client,
+    get_default_client,
+    health,
+    models,
+    prove,
+    prove_and_wait,
+    receipt,
+    verify,
+)
 from .types import FieldSchema, InferenceOutput, Model, Receipt
 
 __all__ = [
     "ClawProof",
     "AsyncClawProof",
     "ClawProofError",
+    "PreparedProveRequest",
     "Receipt",
     "Model",
     "InferenceOutput",
     "FieldSchema",
+    "get_default_client",
+    "get_default_async_client",
+    "health",
+    "models",
+    "prove",
+    "prove_and_wait",
+    "receipt",
+    "verify",
 ]
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import json
+import random
+import secrets
+import socket
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Optional
 
 import httpx
@@ -12,6 +20,47 @@ from .types import Model, Receipt
 _DEFAULT_BASE_URL = "https://clawproof.onrender.com"
 _DEFAULT_TIMEOUT = 30.0
 
+# Only advertise brotli when a decoder is actually installed (the brotli
+# package ships in the optional "speed" extra); httpx raises on a
+# br-encoded body it cannot decompress, so offering it unconditionally
+# would hard-fail the default install against brotli-capable servers.
+if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+    _ACCEPT_ENCODING = "gzip, br"
+else:
+    _ACCEPT_ENCODING = "gzip"
+
+# Optional fast JSON layer: prefer orjson (Rust, bytes in/bytes out), then
+# msgspec's C codec; both skip the stdlib parser's overhead on the hot
+# polling and batch paths.  The SDK works unchanged with stdlib json.
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    try:
+        import msgspec
+
+        def _loads(data: bytes) -> Any:
+            return msgspec.json.decode(data)
+
+        def _dumps(obj: Any) -> bytes:
+            return msgspec.json.encode(obj)
+    except ImportError:
+        def _loads(data: bytes) -> Any:
+            return json.loads(data)
+
+        def _dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+
+
+# Request bodies are serialized with _dumps and sent as raw content, so we
+# set the content type ourselves instead of using httpx's json= path.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class ClawProofError(Exception):
     """Raised when the ClawProof API returns an error response."""
@@ -30,16 +79,59 @@ def _raise_for_error(response: httpx.Response) -> None:
     """Raise :class:`ClawProofError` for non-2xx responses."""
     if response.is_success:
         return
-    try:
-        body = response.json()
-        message = body.get("error", response.text)
-        hint = body.get("hint")
-    except Exception:
+    # Only attempt a JSON parse when the server says it sent JSON; proxy
+    # and gateway errors arrive as HTML/plain text and would pay for a
+    # guaranteed-to-fail parse on every such response.
+    content_type = response.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        try:
+            body = _loads(response.content)
+            message = body.get("error", response.text)
+            hint = body.get("hint")
+        except Exception:
+            message = response.text
+            hint = None
+    else:
         message = response.text
         hint = None
     raise ClawProofError(response.status_code, message, hint)
 
 
+_INITIAL_POLL_DELAY = 0.25
+
+
+def _poll_delay(attempt: int, poll_interval: float) -> float:
+    """Exponential backoff capped at *poll_interval*, with +/-20% jitter.
+
+    Early polls are cheap and quick (a proof is almost never done in the
+    first seconds anyway, but short proofs complete fast); later polls
+    settle at the cap.  Jitter keeps concurrent clients out of lockstep.
+    """
+    # Clamp the exponent: the delay hits any sane cap within a few
+    # doublings, and an unbounded 2**attempt overflows float once a long
+    # wait pushes attempt past ~1024
+    delay = min(poll_interval, _INITIAL_POLL_DELAY * (2 ** min(attempt, 6)))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def _advertise_host(listen_host: str) -> str:
+    """Host to put in a webhook URL for the given bind address.
+
+    A wildcard bind (``0.0.0.0``/``::``) listens on every interface but is
+    not a routable destination — advertising it would point the ClawProof
+    server at its own loopback.  A connected UDP socket reveals the
+    primary outbound interface's address without sending any packets.
+    """
+    if listen_host not in ("", "0.0.0.0", "::"):
+        return listen_host
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        return "127.0.0.1"
+
+
 def _build_prove_payload(
     model_id: str,
     fields: Optional[dict[str, int]] = None,
@@ -60,6 +152,34 @@ def _build_prove_payload(
     return payload
 
 
+class PreparedProveRequest:
+    """A ``/prove`` payload serialized once for reuse across many calls.
+
+    Build one per distinct input and pass it to
+    :meth:`ClawProof.prove_prepared` / :meth:`AsyncClawProof.prove_prepared`
+    in loops, retries, or load generators — the dict construction and JSON
+    encoding happen a single time instead of once per request.
+    """
+
+    __slots__ = ("model_id", "_body")
+
+    def __init__(
+        self,
+        model_id: str,
+        *,
+        fields: Optional[dict[str, int]] = None,
+        text: Optional[str] = None,
+        raw: Optional[list[int]] = None,
+        webhook_url: Optional[str] = None,
+    ) -> None:
+        self.model_id = model_id
+        self._body = _dumps(
+            _build_prove_payload(
+                model_id, fields=fields, text=text, raw=raw, webhook_url=webhook_url
+            )
+        )
+
+
 # ---------------------------------------------------------------------------
 # Synchronous client
 # ---------------------------------------------------------------------------
@@ -83,10 +203,28 @@ class ClawProof:
         timeout: float = _DEFAULT_TIMEOUT,
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._models_etag: Optional[str] = None
+        self._models_cache: Optional[list[Model]] = None
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=timeout,
-            headers={"Accept": "application/json"},
+            # Multiplex concurrent requests over one TCP+TLS connection
+            http2=True,
+            # Keep idle connections around well past the default 5s expiry:
+            # prove_and_wait's backoff tops out above that, and re-doing
+            # TCP+TLS for every poll costs more than a parked socket
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=16,
+                keepalive_expiry=120.0,
+            ),
+            # httpx decompresses transparently; see _ACCEPT_ENCODING for
+            # why brotli is only offered when its decoder is installed
+            headers={
+                "Accept": "application/json",
+                "Accept-Encoding": _ACCEPT_ENCODING,
+            },
         )
 
     # -- lifecycle -----------------------------------------------------------
@@ -107,13 +245,24 @@ class ClawProof:
         """``GET /health`` -- server health and readiness status."""
         resp = self._client.get("/health")
         _raise_for_error(resp)
-        return resp.json()
+        return _loads(resp.content)
 
     def models(self) -> list[Model]:
-        """``GET /models`` -- list all registered models."""
-        resp = self._client.get("/models")
+        """``GET /models`` -- list all registered models.
+
+        Sends ``If-None-Match`` with the last seen ETag; a ``304 Not
+        Modified`` reply reuses the previously parsed list without any
+        JSON decoding.
+        """
+        headers = {"If-None-Match": self._models_etag} if self._models_etag else None
+        resp = self._client.get("/models", headers=headers)
+        if resp.status_code == 304 and self._models_cache is not None:
+            return self._models_cache
         _raise_for_error(resp)
-        return [Model.from_dict(m) for m in resp.json()]
+        models = [Model.from_dict(m) for m in _loads(resp.content)]
+        self._models_etag = resp.headers.get("etag")
+        self._models_cache = models
+        return models
 
     def prove(
         self,
@@ -131,9 +280,15 @@ class ClawProof:
         to poll until completion.
         """
         payload = _build_prove_payload(model_id, fields=fields, text=text, raw=raw, webhook_url=webhook_url)
-        resp = self._client.post("/prove", json=payload)
+        resp = self._client.post("/prove", content=_dumps(payload), headers=_JSON_HEADERS)
+        _raise_for_error(resp)
+        return Receipt.from_dict(_loads(resp.content))
+
+    def prove_prepared(self, request: PreparedProveRequest) -> Receipt:
+        """``POST /prove`` reusing a :class:`PreparedProveRequest`'s body."""
+        resp = self._client.post("/prove", content=request._body, headers=_JSON_HEADERS)
         _raise_for_error(resp)
-        return Receipt.from_dict(resp.json())
+        return Receipt.from_dict(_loads(resp.content))
 
     def prove_and_wait(
         self,
@@ -148,9 +303,9 @@ class ClawProof:
     ) -> Receipt:
         """Submit a proof request and block until it reaches a terminal state.
 
-        Polls ``GET /receipt/{id}`` every *poll_interval* seconds until
-        the receipt status is no longer ``"proving"`` or until *timeout*
-        seconds have elapsed.
+        Polls ``GET /receipt/{id}`` with exponential backoff (capped at
+        *poll_interval* seconds, with jitter) until the receipt status is
+        no longer ``"proving"`` or until *timeout* seconds have elapsed.
 
         Raises :class:`TimeoutError` if the proof does not complete
         within the given timeout.
@@ -162,21 +317,109 @@ class ClawProof:
             raw=raw,
             webhook_url=webhook_url,
         )
-        deadline = time.monotonic() + timeout
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
+        attempt = 0
         while receipt.status == "proving":
-            if time.monotonic() >= deadline:
+            if time.monotonic_ns() >= deadline_ns:
                 raise TimeoutError(
                     f"Proof for receipt {receipt.id} did not complete within {timeout}s"
                 )
-            time.sleep(poll_interval)
+            time.sleep(_poll_delay(attempt, poll_interval))
+            attempt += 1
             receipt = self.receipt(receipt.id)
         return receipt
 
+    def prove_and_wait_webhook(
+        self,
+        model_id: str,
+        *,
+        timeout: float = 300,
+        listen_host: str = "0.0.0.0",
+        listen_port: int = 0,
+        public_base_url: Optional[str] = None,
+        fields: Optional[dict[str, int]] = None,
+        text: Optional[str] = None,
+        raw: Optional[list[int]] = None,
+    ) -> Receipt:
+        """Submit a proof request and wait for its completion webhook.
+
+        Starts an ephemeral local HTTP listener, passes its URL as
+        ``webhook_url`` to ``/prove``, and blocks on the callback instead
+        of polling ``GET /receipt/{id}`` — no wasted round-trips and no
+        poll-interval tail latency.
+
+        *public_base_url* is the externally reachable base URL of the
+        listener; by default it is built from *listen_host* (or, for a
+        wildcard bind, this machine's primary outbound address), which
+        assumes the ClawProof server can reach this machine directly.
+        Behind NAT or an ingress proxy, pass *public_base_url* explicitly.
+
+        Raises :class:`TimeoutError` if no webhook arrives within
+        *timeout* seconds.
+        """
+        token = secrets.token_urlsafe(16)
+        done = threading.Event()
+        received: dict[str, Any] = {}
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802 -- http.server API
+                if self.path != f"/cb/{token}":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                try:
+                    received["payload"] = json.loads(body)
+                except Exception:
+                    received["payload"] = None
+                self.send_response(200)
+                self.end_headers()
+                done.set()
+
+            def log_message(self, *args: Any) -> None:
+                pass  # keep webhook hits out of stderr
+
+        server = ThreadingHTTPServer((listen_host, listen_port), _Handler)
+        port = server.server_address[1]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        base = (
+            public_base_url or f"http://{_advertise_host(listen_host)}:{port}"
+        ).rstrip("/")
+        try:
+            receipt = self.prove(
+                model_id,
+                fields=fields,
+                text=text,
+                raw=raw,
+                webhook_url=f"{base}/cb/{token}",
+            )
+            if receipt.status != "proving":
+                return receipt
+            if not done.wait(timeout):
+                # The webhook may simply have been lost in transit; check
+                # the receipt once before reporting a timeout
+                receipt = self.receipt(receipt.id)
+                if receipt.status != "proving":
+                    return receipt
+                raise TimeoutError(
+                    f"No webhook for receipt {receipt.id} within {timeout}s"
+                )
+            payload = received.get("payload")
+            if payload:
+                return Receipt.from_dict(payload)
+            # Webhook body was empty/unparseable -- fall back to one fetch
+            return self.receipt(receipt.id)
+        finally:
+            server.shutdown()
+            server.server_close()
+
     def receipt(self, receipt_id: str) -> Receipt:
         """``GET /receipt/{id}`` -- fetch a proof receipt by ID."""
         resp = self._client.get(f"/receipt/{receipt_id}")
         _raise_for_error(resp)
-        return Receipt.from_dict(resp.json())
+        return Receipt.from_dict(_loads(resp.content))
 
     def verify(self, receipt_id: str) -> dict:
         """``POST /verify`` -- check whether a receipt's proof is valid.
@@ -184,9 +427,9 @@ class ClawProof:
         Returns the raw JSON response containing ``valid``,
         ``receipt_id``, and ``status`` keys.
         """
-        resp = self._client.post("/verify", json={"receipt_id": receipt_id})
+        resp = self._client.post("/verify", content=_dumps({"receipt_id": receipt_id}), headers=_JSON_HEADERS)
         _raise_for_error(resp)
-        return resp.json()
+        return _loads(resp.content)
 
     def batch_prove(
         self,
@@ -203,11 +446,49 @@ class ClawProof:
                 {"model_id": "authorization", "input": {"fields": {"budget": 15, "trust": 1, "amount": 12, "category": 3, "velocity": 5, "day": 0, "time": 3, "risk": 0}}},
             ])
         """
-        resp = self._client.post("/prove/batch", json={"requests": requests})
+        resp = self._client.post("/prove/batch", content=_dumps({"requests": requests}), headers=_JSON_HEADERS)
         _raise_for_error(resp)
-        data = resp.json()
+        data = _loads(resp.content)
         return [Receipt.from_dict(r) for r in data.get("receipts", [])]
 
+    def prove_many(
+        self,
+        requests: list[dict[str, Any]],
+        *,
+        chunk: int = 5,
+        concurrency: int = 8,
+    ) -> list[Receipt]:
+        """Submit any number of proof requests, 5 per round-trip.
+
+        Fans the ``/prove/batch`` chunks out concurrently on a private
+        async client; see :meth:`AsyncClawProof.prove_many`.
+        """
+        async def _run() -> list[Receipt]:
+            async with AsyncClawProof(self.base_url, timeout=self._timeout) as client:
+                return await client.prove_many(
+                    requests, chunk=chunk, concurrency=concurrency
+                )
+
+        return asyncio.run(_run())
+
+    def receipts(
+        self,
+        receipt_ids: list[str],
+        *,
+        concurrency: int = 16,
+    ) -> list[Receipt]:
+        """Fetch many receipts by ID concurrently.
+
+        Fans the GETs out on a private async client; see
+        :meth:`AsyncClawProof.receipts`.  Results are returned in the same
+        order as *receipt_ids*.
+        """
+        async def _run() -> list[Receipt]:
+            async with AsyncClawProof(self.base_url, timeout=self._timeout) as client:
+                return await client.receipts(receipt_ids, concurrency=concurrency)
+
+        return asyncio.run(_run())
+
 
 # ---------------------------------------------------------------------------
 # Asynchronous client
@@ -231,10 +512,28 @@ class AsyncClawProof:
         timeout: float = _DEFAULT_TIMEOUT,
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._models_etag: Optional[str] = None
+        self._models_cache: Optional[list[Model]] = None
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=timeout,
-            headers={"Accept": "application/json"},
+            # Multiplex concurrent requests over one TCP+TLS connection
+            http2=True,
+            # Keep idle connections around well past the default 5s expiry:
+            # prove_and_wait's backoff tops out above that, and re-doing
+            # TCP+TLS for every poll costs more than a parked socket
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=16,
+                keepalive_expiry=120.0,
+            ),
+            # httpx decompresses transparently; see _ACCEPT_ENCODING for
+            # why brotli is only offered when its decoder is installed
+            headers={
+                "Accept": "application/json",
+                "Accept-Encoding": _ACCEPT_ENCODING,
+            },
         )
 
     # -- lifecycle -----------------------------------------------------------
@@ -255,13 +554,24 @@ class AsyncClawProof:
         """``GET /health`` -- server health and readiness status."""
         resp = await self._client.get("/health")
         _raise_for_error(resp)
-        return resp.json()
+        return _loads(resp.content)
 
     async def models(self) -> list[Model]:
-        """``GET /models`` -- list all registered models."""
-        resp = await self._client.get("/models")
+        """``GET /models`` -- list all registered models.
+
+        Sends ``If-None-Match`` with the last seen ETag; a ``304 Not
+        Modified`` reply reuses the previously parsed list without any
+        JSON decoding.
+        """
+        headers = {"If-None-Match": self._models_etag} if self._models_etag else None
+        resp = await self._client.get("/models", headers=headers)
+        if resp.status_code == 304 and self._models_cache is not None:
+            return self._models_cache
         _raise_for_error(resp)
-        return [Model.from_dict(m) for m in resp.json()]
+        models = [Model.from_dict(m) for m in _loads(resp.content)]
+        self._models_etag = resp.headers.get("etag")
+        self._models_cache = models
+        return models
 
     async def prove(
         self,
@@ -274,9 +584,15 @@ class AsyncClawProof:
     ) -> Receipt:
         """``POST /prove`` -- submit a proof request."""
         payload = _build_prove_payload(model_id, fields=fields, text=text, raw=raw, webhook_url=webhook_url)
-        resp = await self._client.post("/prove", json=payload)
+        resp = await self._client.post("/prove", content=_dumps(payload), headers=_JSON_HEADERS)
         _raise_for_error(resp)
-        return Receipt.from_dict(resp.json())
+        return Receipt.from_dict(_loads(resp.content))
+
+    async def prove_prepared(self, request: PreparedProveRequest) -> Receipt:
+        """``POST /prove`` reusing a :class:`PreparedProveRequest`'s body."""
+        resp = await self._client.post("/prove", content=request._body, headers=_JSON_HEADERS)
+        _raise_for_error(resp)
+        return Receipt.from_dict(_loads(resp.content))
 
     async def prove_and_wait(
         self,
@@ -291,11 +607,10 @@ class AsyncClawProof:
     ) -> Receipt:
         """Submit a proof request and poll until it reaches a terminal state.
 
-        Raises :class:`TimeoutError` if the proof does not complete
-        within the given timeout.
+        Polls with exponential backoff capped at *poll_interval* seconds,
+        with jitter.  Raises :class:`TimeoutError` if the proof does not
+        complete within the given timeout.
         """
-        import asyncio
-
         receipt = await self.prove(
             model_id,
             fields=fields,
@@ -303,34 +618,236 @@ class AsyncClawProof:
             raw=raw,
             webhook_url=webhook_url,
         )
-        deadline = time.monotonic() + timeout
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
+        attempt = 0
         while receipt.status == "proving":
-            if time.monotonic() >= deadline:
+            if time.monotonic_ns() >= deadline_ns:
                 raise TimeoutError(
                     f"Proof for receipt {receipt.id} did not complete within {timeout}s"
                 )
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(_poll_delay(attempt, poll_interval))
+            attempt += 1
             receipt = await self.receipt(receipt.id)
         return receipt
 
+    async def prove_and_wait_webhook(
+        self,
+        model_id: str,
+        *,
+        timeout: float = 300,
+        listen_host: str = "0.0.0.0",
+        listen_port: int = 0,
+        public_base_url: Optional[str] = None,
+        fields: Optional[dict[str, int]] = None,
+        text: Optional[str] = None,
+        raw: Optional[list[int]] = None,
+    ) -> Receipt:
+        """Submit a proof request and await its completion webhook.
+
+        Event-driven counterpart of :meth:`prove_and_wait`: an ephemeral
+        asyncio server receives the server's ``webhook_url`` callback and
+        the call resolves on that event instead of polling.
+
+        Raises :class:`TimeoutError` if no webhook arrives within
+        *timeout* seconds.
+        """
+        token = secrets.token_urlsafe(16)
+        done = asyncio.Event()
+        received: dict[str, Any] = {}
+
+        async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            try:
+                request_line = await reader.readline()
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                parts = request_line.split()
+                ok = len(parts) > 1 and parts[1].decode("latin-1") == f"/cb/{token}"
+                status = b"200 OK" if ok else b"404 Not Found"
+                writer.write(
+                    b"HTTP/1.1 " + status
+                    + b"\r\ncontent-length: 0\r\nconnection: close\r\n\r\n"
+                )
+                await writer.drain()
+                if ok:
+                    try:
+                        received["payload"] = json.loads(body)
+                    except Exception:
+                        received["payload"] = None
+                    done.set()
+            finally:
+                writer.close()
+
+        server = await asyncio.start_server(_handle, listen_host, listen_port)
+        port = server.sockets[0].getsockname()[1]
+        base = (
+            public_base_url or f"http://{_advertise_host(listen_host)}:{port}"
+        ).rstrip("/")
+        try:
+            receipt = await self.prove(
+                model_id,
+                fields=fields,
+                text=text,
+                raw=raw,
+                webhook_url=f"{base}/cb/{token}",
+            )
+            if receipt.status != "proving":
+                return receipt
+            try:
+                await asyncio.wait_for(done.wait(), timeout)
+            except asyncio.TimeoutError:
+                # The webhook may simply have been lost in transit; check
+                # the receipt once before reporting a timeout
+                receipt = await self.receipt(receipt.id)
+                if receipt.status != "proving":
+                    return receipt
+                raise TimeoutError(
+                    f"No webhook for receipt {receipt.id} within {timeout}s"
+                )
+            payload = received.get("payload")
+            if payload:
+                return Receipt.from_dict(payload)
+            return await self.receipt(receipt.id)
+        finally:
+            server.close()
+            await server.wait_closed()
+
     async def receipt(self, receipt_id: str) -> Receipt:
         """``GET /receipt/{id}`` -- fetch a proof receipt by ID."""
         resp = await self._client.get(f"/receipt/{receipt_id}")
         _raise_for_error(resp)
-        return Receipt.from_dict(resp.json())
+        return Receipt.from_dict(_loads(resp.content))
 
     async def verify(self, receipt_id: str) -> dict:
         """``POST /verify`` -- check whether a receipt's proof is valid."""
-        resp = await self._client.post("/verify", json={"receipt_id": receipt_id})
+        resp = await self._client.post("/verify", content=_dumps({"receipt_id": receipt_id}), headers=_JSON_HEADERS)
         _raise_for_error(resp)
-        return resp.json()
+        return _loads(resp.content)
 
     async def batch_prove(
         self,
         requests: list[dict[str, Any]],
     ) -> list[Receipt]:
         """``POST /prove/batch`` -- submit up to 5 proof requests at once."""
-        resp = await self._client.post("/prove/batch", json={"requests": requests})
+        resp = await self._client.post("/prove/batch", content=_dumps({"requests": requests}), headers=_JSON_HEADERS)
         _raise_for_error(resp)
-        data = resp.json()
+        data = _loads(resp.content)
         return [Receipt.from_dict(r) for r in data.get("receipts", [])]
+
+    async def prove_many(
+        self,
+        requests: list[dict[str, Any]],
+        *,
+        chunk: int = 5,
+        concurrency: int = 8,
+    ) -> list[Receipt]:
+        """Submit any number of proof requests, 5 per round-trip.
+
+        Splits *requests* into ``/prove/batch``-sized chunks and keeps up
+        to *concurrency* of them in flight at once via
+        :func:`asyncio.gather`.  Receipts are returned in request order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(group: list[dict[str, Any]]) -> list[Receipt]:
+            async with sem:
+                return await self.batch_prove(group)
+
+        groups = [requests[i:i + chunk] for i in range(0, len(requests), chunk)]
+        results = await asyncio.gather(*(_one(g) for g in groups))
+        return [receipt for batch in results for receipt in batch]
+
+    async def receipts(
+        self,
+        receipt_ids: list[str],
+        *,
+        concurrency: int = 16,
+    ) -> list[Receipt]:
+        """Fetch many receipts by ID, up to *concurrency* in flight at once.
+
+        Receipt fetches are independent GETs, so over the shared HTTP/2
+        connection they multiplex instead of serializing.  Results are
+        returned in the same order as *receipt_ids*.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(receipt_id: str) -> Receipt:
+            async with sem:
+                return await self.receipt(receipt_id)
+
+        return list(await asyncio.gather(*(_one(i) for i in receipt_ids)))
+
+
+# ---------------------------------------------------------------------------
+# Shared default clients
+# ---------------------------------------------------------------------------
+
+
+_default_lock = threading.Lock()
+_default_client: Optional[ClawProof] = None
+_default_async_client: Optional[AsyncClawProof] = None
+
+
+def get_default_client() -> ClawProof:
+    """Return a process-wide shared :class:`ClawProof`, creating it lazily.
+
+    Code that builds a throwaway ``ClawProof()`` per call discards the
+    connection pool — and its TCP/TLS/HTTP2 session — every time.  Routing
+    through the shared client amortizes those handshakes across all calls
+    in the process.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = ClawProof()
+    return _default_client
+
+
+def get_default_async_client() -> AsyncClawProof:
+    """Return a process-wide shared :class:`AsyncClawProof` (lazy-init)."""
+    global _default_async_client
+    if _default_async_client is None:
+        with _default_lock:
+            if _default_async_client is None:
+                _default_async_client = AsyncClawProof()
+    return _default_async_client
+
+
+# Module-level shortcuts that delegate to the shared sync client, for
+# one-liner usage like ``clawproof.prove("authorization", fields={...})``.
+
+def health() -> dict:
+    """Shortcut for :meth:`ClawProof.health` on the shared client."""
+    return get_default_client().health()
+
+
+def models() -> list[Model]:
+    """Shortcut for :meth:`ClawProof.models` on the shared client."""
+    return get_default_client().models()
+
+
+def prove(model_id: str, **kwargs: Any) -> Receipt:
+    """Shortcut for :meth:`ClawProof.prove` on the shared client."""
+    return get_default_client().prove(model_id, **kwargs)
+
+
+def prove_and_wait(model_id: str, **kwargs: Any) -> Receipt:
+    """Shortcut for :meth:`ClawProof.prove_and_wait` on the shared client."""
+    return get_default_client().prove_and_wait(model_id, **kwargs)
+
+
+def receipt(receipt_id: str) -> Receipt:
+    """Shortcut for :meth:`ClawProof.receipt` on the shared client."""
+    return get_default_client().receipt(receipt_id)
+
+
+def verify(receipt_id: str) -> dict:
+    """Shortcut for :meth:`ClawProof.verify` on the shared client."""
+    return get_default_client().verify(receipt_id)
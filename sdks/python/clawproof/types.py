@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
+# Receipts carry the same handful of strings over and over (status values,
+# model ids/names, labels).  Mapping each parsed copy back to one canonical
+# instance keeps a large receipt list from holding thousands of duplicate
+# string objects.
+_INTERN: dict[str, str] = {
+    "proving": "proving",
+    "verified": "verified",
+    "failed": "failed",
+}
 
-@dataclass
+
+def _i(s: str) -> str:
+    """Return the canonical instance of *s*, remembering it if new."""
+    return _INTERN.setdefault(s, s)
+
+
+@dataclass(slots=True)
 class FieldSchema:
     """Schema for a single structured input field accepted by a model."""
 
@@ -16,7 +31,7 @@ class FieldSchema:
     max: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     """Descriptor for a registered model on the ClawProof server."""
 
@@ -56,7 +71,7 @@ class Model:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InferenceOutput:
     """The inference result returned alongside a proof receipt."""
 
@@ -70,12 +85,21 @@ class InferenceOutput:
         return cls(
             raw_output=data.get("raw_output", []),
             predicted_class=data.get("predicted_class", 0),
-            label=data.get("label", ""),
+            label=_i(data.get("label", "")),
             confidence=data.get("confidence", 0.0),
         )
 
 
-@dataclass
+# Shared placeholder for receipts that have no inference output yet
+# (e.g. a fresh /prove response still in "proving").  One instance serves
+# them all instead of allocating a fresh empty InferenceOutput per parse;
+# treat it as read-only.
+_EMPTY_OUTPUT = InferenceOutput(
+    raw_output=[], predicted_class=0, label="", confidence=0.0,
+)
+
+
+@dataclass(slots=True)
 class Receipt:
     """A zkML proof receipt issued by the ClawProof server.
 
@@ -117,27 +141,48 @@ class Receipt:
 
         Handles both the ``/prove`` response shape (which includes
         ``receipt_id``) and the full ``/receipt/{id}`` response shape.
+        Delegates to the decoder generated below.
         """
-        receipt_id = data.get("id") or data.get("receipt_id", "")
-        output_data = data.get("output", {})
-        output = InferenceOutput.from_dict(output_data) if output_data else InferenceOutput(
-            raw_output=[], predicted_class=0, label="", confidence=0.0,
-        )
-        return cls(
-            id=receipt_id,
-            model_id=data.get("model_id", ""),
-            model_name=data.get("model_name", ""),
-            status=data.get("status", ""),
-            created_at=data.get("created_at", ""),
-            output=output,
-            model_hash=data.get("model_hash", ""),
-            input_hash=data.get("input_hash", ""),
-            output_hash=data.get("output_hash", ""),
-            completed_at=data.get("completed_at"),
-            proof_hash=data.get("proof_hash"),
-            proof_size=data.get("proof_size"),
-            prove_time_ms=data.get("prove_time_ms"),
-            verify_time_ms=data.get("verify_time_ms"),
-            error=data.get("error"),
-            receipt_url=data.get("receipt_url"),
-        )
+        return cls._decode_fast(data)
+
+
+# Receipt parsing sits on the hot path of every poll loop, so the decoder
+# is generated once at import time: exec'ing the source below bakes the
+# field list into straight-line code with every collaborator (_i,
+# _EMPTY_OUTPUT, the constructors, dict.get) pre-bound as a default
+# argument, skipping the global lookups a hand-written method would do on
+# each call.
+_DECODER_SRC = '''\
+def _decode(data, _cls=Receipt, _i=_i, _empty=_EMPTY_OUTPUT,
+            _output=InferenceOutput.from_dict):
+    get = data.get
+    output_data = get("output")
+    return _cls(
+        id=get("id") or get("receipt_id", ""),
+        model_id=_i(get("model_id", "")),
+        model_name=_i(get("model_name", "")),
+        status=_i(get("status", "")),
+        created_at=get("created_at", ""),
+        output=_output(output_data) if output_data else _empty,
+        model_hash=get("model_hash", ""),
+        input_hash=get("input_hash", ""),
+        output_hash=get("output_hash", ""),
+        completed_at=get("completed_at"),
+        proof_hash=get("proof_hash"),
+        proof_size=get("proof_size"),
+        prove_time_ms=get("prove_time_ms"),
+        verify_time_ms=get("verify_time_ms"),
+        error=get("error"),
+        receipt_url=get("receipt_url"),
+    )
+'''
+
+_ns: dict = {
+    "Receipt": Receipt,
+    "InferenceOutput": InferenceOutput,
+    "_i": _i,
+    "_EMPTY_OUTPUT": _EMPTY_OUTPUT,
+}
+exec(compile(_DECODER_SRC, "<clawproof.types decoder>", "exec"), _ns)
+Receipt._decode_fast = staticmethod(_ns["_decode"])
+del _ns